@@ -2,18 +2,22 @@
 
 import os
 import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Iterable, List, Optional, Union
+from typing import (Dict, Generator, Iterator, List, NamedTuple, Optional,
+                    Union)
 
 
 USER_SITE_PATH = Path(os.getenv("USERPROFILE", "")) / "AppData" / "Roaming" / "Python"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonPathFile:
     path: Path
-    content: Iterable[str]
+    content: List[str]
+    changed: bool = field(default=True, compare=False)
 
     @property
     def name(self) -> str:
@@ -21,10 +25,10 @@ class PythonPathFile:
 
     @property
     def is_empty(self) -> bool:
-        return len(list(self.content)) == 0
+        return len(self.content) == 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EmbedPython:
     path: Path
     major: int
@@ -32,6 +36,21 @@ class EmbedPython:
     tag: Union[int, str] = field(compare=False)
     architecture: str = field(compare=False)
 
+    @classmethod
+    def from_name(cls, name: str, path: Union[str, Path]) -> Optional["EmbedPython"]:
+        match = match_python_embed(name)
+        if match is None:
+            return None
+        major, minor, tag, arch = match
+        return cls(
+            major=int(major), minor=minor, tag=tag, architecture=arch,
+            path=Path(path)
+        )
+
+    @classmethod
+    def from_path(cls, path: Path) -> Optional["EmbedPython"]:
+        return cls.from_name(path.name, path)
+
     @property
     def short_version(self) -> str:
         return f"{self.major}.{self.minor}"
@@ -45,46 +64,123 @@ class EmbedPython:
         return f"Python {self.long_version}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PythonSitePackage:
     python: EmbedPython
-    path_files: Iterable[PythonPathFile]
+    path_files: List[PythonPathFile]
 
 
 PYTHON_PATTERN = re.compile(
-    r"python-(?P<major>\d+).(?P<minor>[0-9a-zA-Z]{,4}).(?P<tag>[0-9a-zA-Z]{,5})-embed-(?P<arch>.*).zip$"
+    r"\Apython-(?P<major>\d+)\.(?P<minor>[0-9a-zA-Z]{1,4})\.(?P<tag>[0-9a-zA-Z]{1,5})-embed-(?P<arch>amd64|win32|arm64)\.zip\Z",
+    re.ASCII
 )
 
+EMBED_PREFIX = "python-"
+EMBED_MARKER = "-embed-"
+EMBED_SUFFIX = ".zip"
+EMBED_ARCHITECTURES = frozenset(
+    sys.intern(arch) for arch in ("amd64", "win32", "arm64")
+)
 
+_WSL_RE = re.compile(r"^/mnt/([a-zA-Z])/")
+_BACKSLASH = str.maketrans("\\", "/")
+
+
+@lru_cache(maxsize=32)
 def user_site_pkg_path(python: EmbedPython) -> Path:
     version = f"Python{python.major}{python.minor}"
     return USER_SITE_PATH / version / "site-packages"
 
 
 def read_path_file(file: Path) -> List[str]:
-    with file as f:
-        content = f.read_text(encoding="utf-8")
-        return content.splitlines(keepends=False)
+    return file.read_text(encoding="utf-8").splitlines()
+
+
+class EmbedMatch(NamedTuple):
+    major: str
+    minor: str
+    tag: str
+    arch: str
+
+    def group(self, name: str) -> str:
+        if name not in self._fields:
+            raise IndexError("no such group")
+        return getattr(self, name)
+
+
+def _is_version_part(value: str, max_length: int) -> bool:
+    return 0 < len(value) <= max_length and value.isascii() and value.isalnum()
+
+
+def _is_candidate(name: str) -> bool:
+    return (name.startswith(EMBED_PREFIX) and name.endswith(EMBED_SUFFIX)
+            and EMBED_MARKER in name)
+
+
+@lru_cache(maxsize=1024)
+def _match_python(name: str) -> Optional[EmbedMatch]:
+    start = len(EMBED_PREFIX)
+    end = len(name) - len(EMBED_SUFFIX)
+    marker = name.find(EMBED_MARKER, start, end)
+    if marker < 0:
+        return None
+    arch = name[marker + len(EMBED_MARKER):end]
+    if arch not in EMBED_ARCHITECTURES:
+        return None
+    version = name[start:marker].split(".")
+    if len(version) != 3:
+        return None
+    major, minor, tag = version
+    if not (major.isascii() and major.isdigit()):
+        return None
+    if not _is_version_part(minor, 4) or not _is_version_part(tag, 5):
+        return None
+    return EmbedMatch(major, sys.intern(minor), sys.intern(tag), sys.intern(arch))
+
+
+# Accepts exactly the names PYTHON_PATTERN matches, without running it.
+def match_python_embed(name: str) -> Optional[EmbedMatch]:
+    if not _is_candidate(name):
+        return None
+    return _match_python(name)
+
+
+def _wsl_drive(match: re.Match) -> str:
+    return f"{match.group(1).upper()}:/"
 
 
 def _get_path(path: str) -> str:
-    wsl_mount = "/mnt/c/"
-    if path.startswith(wsl_mount):
-        path = path.removeprefix(wsl_mount)
-        path = f"C:/{path}"
-    return path.replace("\\", "/")
+    return _WSL_RE.sub(_wsl_drive, path).translate(_BACKSLASH)
 
 
 def write_path_file(path_file: PythonPathFile) -> None:
-    lines = [_get_path(line) for line in path_file.content]
-    content = "\n".join(lines)
-    with path_file.path as f:
-        f.write_text(data=content, encoding="utf-8")
+    content = "\n".join(map(_get_path, path_file.content))
+    path_file.path.write_text(content, encoding="utf-8", newline="\n")
+
+
+def _is_file(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def _scan_files(directory: Path, extension: str) -> Iterator[os.DirEntry]:
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(extension) or not _is_file(entry):
+                continue
+            yield entry
 
 
 def path_files_from(site_package: Path, extension: Optional[str] = None) -> Generator[PythonPathFile, None, None]:
-    extension = extension or "*.pth"
-    for path in site_package.glob(extension):
+    extension = extension or ".pth"
+    for entry in _scan_files(site_package, extension):
+        path = Path(entry.path)
         content = read_path_file(path)
         yield PythonPathFile(path, content)
 
@@ -93,58 +189,70 @@ def site_package_from(python: EmbedPython, extension: Optional[str] = None) -> P
     site_package = user_site_pkg_path(python)
     return PythonSitePackage(
         python=python,
-        path_files=path_files_from(site_package, extension)
+        path_files=list(path_files_from(site_package, extension))
     )
 
 
+def _delete_path_file(path_file: PythonPathFile) -> None:
+    try:
+        os.unlink(path_file.path)
+    except FileNotFoundError:
+        return
+
+
 def save_site_package(site: PythonSitePackage) -> None:
-    for path_file in site.path_files:
-        if path_file.is_empty:
-            os.remove(path_file.path)
-        else:
-            write_path_file(path_file)
+    to_delete = [file for file in site.path_files if file.is_empty]
+    to_write = [file for file in site.path_files
+                if not file.is_empty and file.changed]
+    for path_file in to_delete:
+        _delete_path_file(path_file)
+    for path_file in to_write:
+        write_path_file(path_file)
 
 
 def embed_versions(search_path: Path) -> List[EmbedPython]:
     versions = []
-    for path in search_path.glob("*.zip"):
-        match = PYTHON_PATTERN.match(path.name)
-        if match is None:
+    for entry in _scan_files(search_path, EMBED_SUFFIX):
+        python = EmbedPython.from_name(entry.name, entry.path)
+        if python is None:
             continue
-        versions.append(
-            EmbedPython(
-                major=int(match.group("major")),
-                minor=match.group("minor"),
-                tag=match.group("tag"),
-                architecture=match.group("arch"),
-                path=path
-            ))
+        versions.append(python)
     return versions
 
 
-def _is_embed_python(name: str, embed: EmbedPython) -> bool:
-    return embed.short_version in name
-
-
-def embed_python_by(name: str, search_path: Path) -> Optional[EmbedPython]:
-    for embed in embed_versions(search_path):
-        if not _is_embed_python(name, embed):
-            continue
-        return embed
-    return None
-
-
 class PythonConfigService:
     # embed_path = Path(os.getenv("%LOCALAPPDATA%", ""))
     embed_path = Path(os.getenv("USERPROFILE", "")) / "AppData" / "Local"
 
+    def __init__(self) -> None:
+        self._versions_cache: Optional[List[EmbedPython]] = None
+        self._versions_index: Dict[str, EmbedPython] = {}
+        self._versions_mtime: Optional[float] = None
+
+    def _embed_path_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.embed_path).st_mtime
+        except OSError:
+            return None
+
     def embed_versions(self) -> List[EmbedPython]:
-        return embed_versions(self.embed_path)
+        mtime = self._embed_path_mtime()
+        if self._versions_cache is not None and mtime == self._versions_mtime:
+            return self._versions_cache
+        versions = embed_versions(self.embed_path)
+        index: Dict[str, EmbedPython] = {}
+        for embed in versions:
+            index.setdefault(embed.full_name, embed)
+        self._versions_cache = versions
+        self._versions_index = index
+        self._versions_mtime = mtime
+        return versions
 
     def embed_python_by(self, name: str) -> Optional[EmbedPython]:
         if name is None or len(name.strip()) == 0:
             return None
-        return embed_python_by(name, self.embed_path)
+        self.embed_versions()
+        return self._versions_index.get(name)
 
     def site_package_from(self, embed: EmbedPython) -> PythonSitePackage:
         return site_package_from(embed)
@@ -3,14 +3,15 @@
 import os
 import subprocess
 import tkinter as tk
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from tkinter import filedialog as file
 from tkinter import messagebox as msg
 from tkinter import simpledialog as dlg
 from tkinter import ttk
-from typing import Callable, Dict, Iterable, List, Optional, Protocol, Union
+from typing import (Callable, Dict, Iterable, Iterator, List, Optional,
+                    Protocol, Union)
 
 
 from dynpy.service import EmbedPython, PythonPathFile, PythonSitePackage
@@ -42,7 +43,14 @@ class Event(Enum):
     PATH_REMOVE = "python_remove"
 
 
-@dataclass
+def _remove_instance(models: List, model: object) -> None:
+    for index, current in enumerate(models):
+        if current is model:
+            del models[index]
+            return
+
+
+@dataclass(slots=True)
 class PathEntryViewModel:
     path: str
     parent_uuid: str
@@ -54,13 +62,22 @@ class PathEntryViewModel:
         return self.path
 
 
-@dataclass
+@dataclass(slots=True)
 class PathFileViewModel:
     path: Path
     content: List[PathEntryViewModel]
     model_uuid: str = ""
     parent_uuid: str = ""
     changed: bool = False
+    on_changed: Optional[Callable[["PathFileViewModel"], None]] = field(
+        default=None, repr=False, compare=False
+    )
+    _entries: Dict[int, PathEntryViewModel] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self._entries.update((id(model), model) for model in self.content)
 
     @property
     def is_empty(self) -> bool:
@@ -80,17 +97,25 @@ class PathFileViewModel:
     def name(self) -> str:
         return self.path.name
 
+    def mark_changed(self) -> None:
+        if self.changed:
+            return
+        self.changed = True
+        if self.on_changed is not None:
+            self.on_changed(self)
+
     def add(self, model: PathEntryViewModel) -> None:
-        if model in self.content:
+        if id(model) in self._entries:
             return
+        self._entries[id(model)] = model
         self.content.append(model)
-        self.changed = True
+        self.mark_changed()
 
     def remove(self, model: PathEntryViewModel) -> None:
-        if model not in self.content:
+        if self._entries.pop(id(model), None) is None:
             return
-        self.content.remove(model)
-        self.changed = True
+        _remove_instance(self.content, model)
+        self.mark_changed()
 
     def create(self, path: str) -> PathEntryViewModel:
         model = PathEntryViewModel(
@@ -108,39 +133,49 @@ def create_view_model(file: PythonPathFile) -> PathFileViewModel:
 
 
 class PythonConfigController:
-    listeners: Dict[Event, List[Callable]] = {}
 
     def __init__(self, service: IPyConfService) -> None:
         self.service = service
+        self.listeners: Dict[Event, List[Callable]] = {
+            event: [] for event in Event
+        }
         self.last_directory = os.getenv("USERPROFILE")
         self.uuid: Dict[str, Union[PathFileViewModel, PathEntryViewModel]] = {}
+        self.children: Dict[str, List[PathEntryViewModel]] = {}
+        self.path_files: List[PathFileViewModel] = []
+        self.removed_files: List[PathFileViewModel] = []
         self.deleted: List[str] = []
+        self._dirty_count = 0
         self.current_id: Optional[str] = None
         self.python: Optional[EmbedPython] = None
         self.master: Optional[tk.Misc] = None
+        self.explorers: List[subprocess.Popen] = []
 
     def reset(self):
         self.uuid.clear()
+        self.children.clear()
+        self.path_files.clear()
+        self.removed_files.clear()
         self.deleted.clear()
+        self._dirty_count = 0
         self.current_id = None
         self.python = None
 
     def get_python_versions(self) -> List[str]:
         return [py.full_name for py in self.service.embed_versions()]
 
-    def user_site_package_of(self, python: Optional[EmbedPython]) -> List[PathFileViewModel]:
+    def user_site_package_of(self, python: Optional[EmbedPython]) -> Iterator[PathFileViewModel]:
         if python is None:
-            return []
+            return
         site_package = self.service.site_package_from(python)
-        return [create_view_model(file=file) for file in site_package.path_files]
+        for path_file in site_package.path_files:
+            yield create_view_model(file=path_file)
 
     def register(self, event: Event, callback: Callable):
-        if event not in self.listeners:
-            self.listeners[event] = []
         self.listeners[event].append(callback)
 
     def fire_event(self, event: Event, *args, **kwargs):
-        for callback in self.listeners.get(event, []):
+        for callback in self.listeners[event]:
             callback(*args, **kwargs)
 
     def fire_python_changed(self, version: str):
@@ -167,12 +202,30 @@ class PythonConfigController:
             message="Nicht gespeicherte Änderungen zuerst speichern?",
         )
 
+    def add_model(self, model: Union[PathFileViewModel, PathEntryViewModel]) -> None:
+        self.uuid[model.uuid] = model
+        if isinstance(model, PathEntryViewModel):
+            self.children.setdefault(model.parent_uuid, []).append(model)
+        else:
+            self.path_files.append(model)
+            model.on_changed = self._on_model_changed
+        if model.changed:
+            self._dirty_count += 1
+
+    def _on_model_changed(self, model: PathFileViewModel) -> None:
+        self._dirty_count += 1
+
+    def _mark_saved(self) -> None:
+        for model in self.uuid.values():
+            model.changed = False
+        self.removed_files.clear()
+        self.deleted.clear()
+        self._dirty_count = 0
+
     def contains_unsaved(self) -> bool:
-        if len(self.deleted) > 0:
-            return True
-        if not any(model.changed for _, model in self.uuid.items()):
-            return False
-        return self.ask_safe_changes()
+        if self.deleted or self._dirty_count:
+            return self.ask_safe_changes()
+        return False
 
     def on_version_select(self, event: tk.Event):
         if self.python is not None and self.contains_unsaved():
@@ -259,19 +312,21 @@ class PythonConfigController:
     def _get_child_of(self, current: Union[PathFileViewModel, PathEntryViewModel]) -> List[PathEntryViewModel]:
         if isinstance(current, PathEntryViewModel):
             return []
-
-        def is_parent(model: Union[PathFileViewModel, PathEntryViewModel]) -> bool:
-            if isinstance(model, PathFileViewModel):
-                return False
-            return model.parent_uuid == current.uuid
-
-        models = [model for _, model in self.uuid.items() if is_parent(model)]
-        return [model for model in models if isinstance(model, PathEntryViewModel)]
+        return list(self.children.get(current.uuid, ()))
 
     def _update_models_in_uuid_dict(self, models: Iterable[Union[PathFileViewModel, PathEntryViewModel]]):
         for model in models:
             self.uuid.pop(model.uuid)
             self.deleted.append(model.uuid)
+            if model.changed:
+                self._dirty_count -= 1
+            if isinstance(model, PathFileViewModel):
+                model.on_changed = None
+                self.children.pop(model.uuid, None)
+                _remove_instance(self.path_files, model)
+                self.removed_files.append(model)
+                continue
+            _remove_instance(self.children.get(model.parent_uuid, []), model)
 
     def _update_path_file_model(self, current: Union[PathFileViewModel, PathEntryViewModel],
                                 models: Iterable[Union[PathFileViewModel, PathEntryViewModel]]):
@@ -304,18 +359,30 @@ class PythonConfigController:
         win_dir = os.getenv('WINDIR', "")
         explorer = os.path.join(win_dir, 'explorer.exe')
         path = os.path.normpath(path)
-        subprocess.run([explorer, '/select,', path], check=False)
+        self._reap_explorers()
+        self.explorers.append(subprocess.Popen([explorer, '/select,', path]))
+
+    def _reap_explorers(self):
+        # Explorer is not waited for; polling reaps finished processes so
+        # their handles are not collected while still running.
+        self.explorers = [
+            process for process in self.explorers if process.poll() is None
+        ]
 
     def _create_py_path(self, model: PathFileViewModel) -> PythonPathFile:
         content = [model.path for model in self._get_child_of(model)]
-        return PythonPathFile(path=model.path, content=content)
+        return PythonPathFile(
+            path=model.path, content=content, changed=model.changed
+        )
 
     def _path_file_models(self) -> List[PathFileViewModel]:
-        return [model for _, model in self.uuid.items() if isinstance(model, PathFileViewModel)]
+        return self.path_files
 
     def _create_python_path_files(self) -> List[PythonPathFile]:
-        models = [self._create_py_path(model)
-                  for model in self._path_file_models()]
+        models = [PythonPathFile(path=model.path, content=[])
+                  for model in self.removed_files]
+        models.extend(self._create_py_path(model)
+                      for model in self._path_file_models())
         return models
 
     def path_entry_save_command(self):
@@ -324,3 +391,4 @@ class PythonConfigController:
         path_files = self._create_python_path_files()
         site = PythonSitePackage(python=self.python, path_files=path_files)
         self.service.save_site_package(site)
+        self._mark_saved()
@@ -1,11 +1,11 @@
 
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from tkinter import (Button, Entry, Frame, Label, Misc, StringVar, Tk,
                      Toplevel, Variable, Widget)
 from tkinter.constants import DISABLED, EW, GROOVE, NORMAL, NSEW, W
 from tkinter.ttk import Combobox, LabelFrame, Treeview
-from typing import (Any, Callable, ClassVar, Dict, Iterable, Optional, Tuple,
-                    Type, TypeVar, Union)
+from typing import (Any, Callable, Dict, Iterable, Optional, Tuple, Type,
+                    TypeVar, Union)
 
 UiElement = Union[Button, Label, Entry]
 UiWidget = Union[UiElement, Frame, Widget, Treeview]
@@ -13,12 +13,8 @@ UiWidget = Union[UiElement, Frame, Widget, Treeview]
 TUi = TypeVar("TUi", bound=Widget)
 
 
-@dataclass
+@dataclass(slots=True)
 class UiArgs:
-    exclude_grid: ClassVar[Iterable[str]] = [
-        'padx_east', 'west_min', 'east_min'
-    ]
-
     row: int = 0
     column: int = 0
     columnspan: int = 1
@@ -48,16 +44,26 @@ class UiArgs:
         self.column += 1
 
     def as_grid(self, **kwargs) -> Dict[str, Any]:
-        args = self.as_args(**kwargs)
-        for attr in self.exclude_grid:
-            args.pop(attr)
-        return args
+        return {
+            'row': self.row,
+            'column': self.column,
+            'columnspan': self.columnspan,
+            'padx': self.padx,
+            'pady': self.pady,
+            'ipadx': self.ipadx,
+            'ipady': self.ipady,
+            'sticky': self.sticky,
+            **kwargs
+        }
 
     def as_args(self, **kwargs) -> Dict[str, Any]:
-        args = asdict(self)
-        for name, value in kwargs.items():
-            args[name] = value
-        return args
+        return {
+            **self.as_grid(),
+            'padx_east': self.padx_east,
+            'east_min': self.east_min,
+            'west_min': self.west_min,
+            **kwargs
+        }
 
 
 def enable(ui_element: UiElement) -> None:
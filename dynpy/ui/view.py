@@ -80,13 +80,14 @@ class PythonVersionView(tk.Listbox):
 
 
 class SitePackageView(ttk.Treeview):
+    tag = "dynpy"
+    tags = (tag,)
 
     def __init__(self, master: Misc | None, controller: PythonConfigController) -> None:
 
         super().__init__(master, show="tree", selectmode=tk.BROWSE)
         self.controller = controller
         self.args = utils.UiArgs(sticky=tk.NSEW)
-        self.tag = "dynpy"
         self.file_icon = tk.PhotoImage(file="")
         self.dir_icon = tk.PhotoImage(file="")
 
@@ -106,11 +107,11 @@ class SitePackageView(ttk.Treeview):
 
     def add_item(self, parent: str, model: Union[PathFileViewModel, PathEntryViewModel]) -> str:
         tree_id = self.insert(
-            parent, tk.END, text=model.name, image="", tags=(self.tag,)
+            parent, tk.END, text=model.name, image="", tags=self.tags
         )
         model.uuid = tree_id
         model.parent_uuid = parent
-        self.controller.uuid[tree_id] = model
+        self.controller.add_model(model)
         return tree_id
 
     def _add_python_path_content(self, parent: str, models: Iterable[PathEntryViewModel]):
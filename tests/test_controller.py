@@ -0,0 +1,171 @@
+import itertools
+import unittest
+from pathlib import Path
+from typing import List, Optional
+from unittest import mock
+
+from dynpy.service import EmbedPython, PythonPathFile, PythonSitePackage
+from dynpy.ui.controller import (Event, PathEntryViewModel, PathFileViewModel,
+                                 PythonConfigController)
+
+
+class FakeService:
+
+    def __init__(self) -> None:
+        self.python = EmbedPython(
+            path=Path("python-3.9.12-embed-amd64.zip"), major=3, minor="9",
+            tag="12", architecture="amd64"
+        )
+        self.saved: List[PythonSitePackage] = []
+
+    def embed_versions(self) -> List[EmbedPython]:
+        return [self.python]
+
+    def embed_python_by(self, name: str) -> Optional[EmbedPython]:
+        if name != self.python.full_name:
+            return None
+        return self.python
+
+    def site_package_from(self, embed: EmbedPython) -> PythonSitePackage:
+        return PythonSitePackage(python=embed, path_files=[
+            PythonPathFile(Path("a.pth"), ["C:/a1", "C:/a2"]),
+            PythonPathFile(Path("b.pth"), ["C:/b1"]),
+        ])
+
+    def save_site_package(self, site: PythonSitePackage) -> None:
+        self.saved.append(site)
+
+    def user_site_package_of(self, embed: EmbedPython) -> Path:
+        return Path("site-packages")
+
+
+# Registers models the same way SitePackageView.add_item does.
+class FakeTree:
+
+    def __init__(self, controller: PythonConfigController) -> None:
+        self.controller = controller
+        self.ids = itertools.count()
+        controller.register(Event.PYTHON, self.on_python_version_changed)
+        controller.register(Event.PATH_ADD, self.add_item)
+        controller.register(Event.PATH_REMOVE, self.on_path_file_remove)
+
+    def add_item(self, parent: str, model) -> str:
+        model.uuid = f"I{next(self.ids)}"
+        model.parent_uuid = parent
+        self.controller.add_model(model)
+        return model.uuid
+
+    def on_path_file_remove(self, models) -> None:
+        return None
+
+    def on_python_version_changed(self, python: EmbedPython) -> None:
+        for model in self.controller.user_site_package_of(python):
+            parent = self.add_item(parent="", model=model)
+            for entry in model.content:
+                self.add_item(parent=parent, model=entry)
+
+
+class TestController(unittest.TestCase):
+
+    def setUp(self):
+        self.service = FakeService()
+        self.controller = PythonConfigController(self.service)
+        self.tree = FakeTree(self.controller)
+        self.controller.select_directory = lambda: "C:/new"
+        self.controller.fire_python_changed(self.service.python.full_name)
+
+    def _path_file(self, name: str) -> PathFileViewModel:
+        return next(file for file in self.controller.path_files
+                    if file.name == name)
+
+    def _entry(self, path: str) -> PathEntryViewModel:
+        return next(model for model in self.controller.uuid.values()
+                    if isinstance(model, PathEntryViewModel) and model.path == path)
+
+    def _saved_files(self):
+        site = self.service.saved[-1]
+        return {file.name: (file.content, file.changed) for file in site.path_files}
+
+    def test_loaded_site_package_is_clean(self):
+        self.assertEqual(len(self.controller.uuid), 5)
+        self.assertEqual(self.controller._dirty_count, 0)
+        self.assertFalse(self.controller.contains_unsaved())
+
+    def test_add_entry_marks_entry_and_file(self):
+        self.controller.current_id = self._entry("C:/a1").uuid
+
+        self.controller.path_entry_add_command()
+
+        path_file = self._path_file("a.pth")
+        self.assertEqual([entry.path for entry in path_file.content],
+                         ["C:/a1", "C:/a2", "C:/new"])
+        self.assertIn(self._entry("C:/new"), self.controller.children[path_file.uuid])
+        self.assertEqual(self.controller._dirty_count, 2)
+
+    def test_remove_entry_marks_file(self):
+        self.controller.current_id = self._entry("C:/a1").uuid
+
+        self.controller.path_entry_remove_command()
+
+        path_file = self._path_file("a.pth")
+        self.assertEqual([entry.path for entry in path_file.content], ["C:/a2"])
+        self.assertEqual(self.controller._dirty_count, 1)
+        self.assertEqual(len(self.controller.deleted), 1)
+
+    def test_remove_file_counts_nothing_for_the_removed_file(self):
+        path_file = self._path_file("b.pth")
+        self.controller.current_id = path_file.uuid
+
+        self.controller.path_entry_remove_command()
+
+        self.assertNotIn(path_file, self.controller.path_files)
+        self.assertNotIn(path_file.uuid, self.controller.children)
+        self.assertEqual(self.controller._dirty_count, 0)
+        self.assertEqual(len(self.controller.deleted), 2)
+
+    def test_save_writes_changes_and_deletes_removed_files(self):
+        self.controller.current_id = self._entry("C:/a1").uuid
+        self.controller.path_entry_remove_command()
+        self.controller.current_id = self._path_file("b.pth").uuid
+        self.controller.path_entry_remove_command()
+
+        self.controller.path_entry_save_command()
+
+        self.assertEqual(self._saved_files(), {
+            "a.pth": (["C:/a2"], True),
+            "b.pth": ([], True),
+        })
+        self.assertEqual(self.controller._dirty_count, 0)
+        self.assertEqual(self.controller.deleted, [])
+        self.assertFalse(self.controller.contains_unsaved())
+
+    def test_change_after_save_is_counted_again(self):
+        self.controller.current_id = self._entry("C:/a1").uuid
+        self.controller.path_entry_remove_command()
+        self.controller.path_entry_save_command()
+
+        self.controller.current_id = self._entry("C:/a2").uuid
+        self.controller.path_entry_remove_command()
+
+        self.assertEqual(self.controller._dirty_count, 1)
+        self.controller.path_entry_save_command()
+        self.assertEqual(self._saved_files(), {"a.pth": ([], True), "b.pth": (["C:/b1"], False)})
+
+    def test_show_in_explorer_reaps_finished_processes(self):
+        finished = mock.Mock(**{"poll.return_value": 0})
+        running = mock.Mock(**{"poll.return_value": None})
+        popen = mock.Mock(side_effect=[finished, running, running])
+
+        with mock.patch("os.path.exists", return_value=True), \
+                mock.patch("subprocess.Popen", popen):
+            self.controller.show_in_explorer("C:/a1")
+            self.assertEqual(self.controller.explorers, [finished])
+            self.controller.show_in_explorer("C:/a2")
+            self.controller.show_in_explorer("C:/a2")
+
+        self.assertEqual(self.controller.explorers, [running, running])
+        finished.poll.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
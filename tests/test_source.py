@@ -1,13 +1,49 @@
 
 # python_version_manager/tests/test_site_packages_viewer.py
+import os
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from dynpy import service as ser
 
 
+class _ScandirWithUnreadable:
+    def __init__(self, unreadable: str) -> None:
+        self.unreadable = unreadable
+        self.scandir = os.scandir
+        self.entries = []
+
+    def __call__(self, path):
+        with self.scandir(path) as entries:
+            entries = sorted(entries, key=lambda e: e.name != self.unreadable)
+            self.entries = [self._entry(entry) for entry in entries]
+        return self
+
+    def _entry(self, entry):
+        if entry.name != self.unreadable:
+            return entry
+        return mock.Mock(
+            path=entry.path, is_file=mock.Mock(side_effect=PermissionError(entry.path)),
+            **{"name": entry.name}
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return None
+
+    def __iter__(self):
+        return iter(self.entries)
+
+
 class TestSource(unittest.TestCase):
 
+    def tearDown(self):
+        ser._match_python.cache_clear()
+
     def test_regex_embed_python(self):
         path = Path("path/to/embed/python-3.9.12-embed-amd64.zip")
 
@@ -32,6 +68,204 @@ class TestSource(unittest.TestCase):
         self.assertEqual(result.group("tag"), "12")
         self.assertEqual(result.group("arch"), "amd64")
 
+    def test_regex_embed_python_win32(self):
+        path = Path("path/to/embed/python-3.12.4-embed-win32.zip")
+
+        result = ser.PYTHON_PATTERN.match(path.name)
+        self.assertIsNotNone(result, path.name)
+        if result is None:
+            return
+        self.assertEqual(result.group("major"), "3")
+        self.assertEqual(result.group("minor"), "12")
+        self.assertEqual(result.group("tag"), "4")
+        self.assertEqual(result.group("arch"), "win32")
+
+    def test_match_python_embed_equals_pattern(self):
+        names = [
+            "python-3.9.12-embed-amd64.zip",
+            "python-3.9rc.12-embed-amd64.zip",
+            "python-3.12.4-embed-win32.zip",
+            "python-3.9.12-embed-amd64.zip.bak",
+            "python-3.9-embed-amd64.zip",
+            "python-3..12-embed-amd64.zip",
+            "python-3.9.12.1-embed-amd64.zip",
+            "python-x.9.12-embed-amd64.zip",
+            "python-3.9.12-embed-.zip",
+            "python-3.9.12-embed-am.d64.zip",
+            "python-3.9.12-embed-x86.zip",
+            "python-3.11.9-embed-arm64.zip",
+            "python-3.9.12-amd64.zip",
+            "readme.txt",
+        ]
+        for name in names:
+            expected = ser.PYTHON_PATTERN.fullmatch(name)
+            result = ser.match_python_embed(name)
+            if expected is None:
+                self.assertIsNone(result, name)
+                continue
+            self.assertIsNotNone(result, name)
+            if result is None:
+                continue
+            for group in ("major", "minor", "tag", "arch"):
+                self.assertEqual(result.group(group), expected.group(group), name)
+            for group in ("count", "index", "_fields"):
+                with self.assertRaises(IndexError):
+                    result.group(group)
+
+    def test_match_python_embed_rejects_non_candidate(self):
+        cache_before = ser._match_python.cache_info()
+
+        for name in ("readme.txt", "python-3.9.12-amd64.zip", "embed.zip"):
+            self.assertIsNone(ser.match_python_embed(name), name)
+        self.assertEqual(ser._match_python.cache_info(), cache_before)
+
+    def test_embed_python_from_path(self):
+        path = Path("path/to/embed/python-3.9.12-embed-amd64.zip")
+
+        result = ser.EmbedPython.from_path(path)
+        self.assertIsNotNone(result, path.name)
+        if result is None:
+            return
+        self.assertEqual(result.path, path)
+        self.assertEqual(result.major, 3)
+        self.assertEqual(result.minor, "9")
+        self.assertEqual(result.tag, "12")
+        self.assertEqual(result.architecture, "amd64")
+        self.assertEqual(result.full_name, "Python 3.9.12")
+
+    def test_embed_python_from_path_without_match(self):
+        path = Path("path/to/embed/python-3.9.12-amd64.zip")
+
+        self.assertIsNone(ser.EmbedPython.from_path(path))
+
+    def test_embed_versions_reuses_parsed_archives(self):
+        names = [
+            "python-3.9.12-embed-amd64.zip",
+            "python-3.12.4-embed-win32.zip",
+            "python-3.12.4-amd64.exe",
+            "readme.zip",
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            for name in names:
+                (Path(directory) / name).touch()
+
+            ser._match_python.cache_clear()
+            first = ser.embed_versions(Path(directory))
+            second = ser.embed_versions(Path(directory))
+
+        self.assertEqual(
+            sorted(python.full_name for python in first),
+            ["Python 3.12.4", "Python 3.9.12"]
+        )
+        self.assertCountEqual(first, second)
+        self.assertEqual(ser._match_python.cache_info().misses, 2)
+        self.assertEqual(ser._match_python.cache_info().hits, 2)
+
+    def test_save_site_package(self):
+        python = ser.EmbedPython(
+            path=Path("python-3.9.12-embed-amd64.zip"), major=3, minor="9",
+            tag="12", architecture="amd64"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            unchanged = Path(directory) / "unchanged.pth"
+            changed = Path(directory) / "changed.pth"
+            emptied = Path(directory) / "emptied.pth"
+            never_written = Path(directory) / "never_written.pth"
+            emptied.write_text("C:/old", encoding="utf-8")
+            unchanged.write_text("C:/old", encoding="utf-8")
+            changed.write_text("C:/old", encoding="utf-8")
+            site = ser.PythonSitePackage(python=python, path_files=[
+                ser.PythonPathFile(unchanged, ["C:/new"], changed=False),
+                ser.PythonPathFile(changed, ["C:/new"], changed=True),
+                ser.PythonPathFile(emptied, []),
+                ser.PythonPathFile(never_written, []),
+            ])
+
+            ser.save_site_package(site)
+
+            self.assertEqual(unchanged.read_text(encoding="utf-8"), "C:/old")
+            self.assertEqual(changed.read_text(encoding="utf-8"), "C:/new")
+            self.assertFalse(emptied.exists())
+            self.assertFalse(never_written.exists())
+
+    def test_path_files_from_skips_unreadable_entries(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("a.pth", "b.pth", "c.pth"):
+                (Path(directory) / name).write_text(name, encoding="utf-8")
+
+            scandir = _ScandirWithUnreadable(unreadable="a.pth")
+            with mock.patch.object(ser.os, "scandir", scandir):
+                result = ser.path_files_from(Path(directory))
+                names = sorted(path_file.name for path_file in result)
+
+        self.assertEqual(names, ["b.pth", "c.pth"])
+
+    def test_path_files_from_without_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            not_a_directory = Path(directory) / "file.pth"
+            not_a_directory.touch()
+
+            self.assertEqual(list(ser.path_files_from(not_a_directory)), [])
+            self.assertEqual(list(ser.path_files_from(Path(directory) / "missing")), [])
+
+    def test_service_caches_embed_versions_until_directory_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "python-3.12.4-embed-amd64.zip").touch()
+            service = ser.PythonConfigService()
+            service.embed_path = Path(directory)
+
+            first = service.embed_versions()
+            self.assertIs(service.embed_versions(), first)
+
+            (Path(directory) / "python-3.12.1-embed-amd64.zip").touch()
+            os.utime(directory, (0, 0))
+            second = service.embed_versions()
+
+        self.assertIsNot(second, first)
+        self.assertEqual(
+            sorted(python.full_name for python in second),
+            ["Python 3.12.1", "Python 3.12.4"]
+        )
+
+    def test_service_embed_python_by_full_name(self):
+        with tempfile.TemporaryDirectory() as directory:
+            (Path(directory) / "python-3.12.4-embed-amd64.zip").touch()
+            (Path(directory) / "python-3.12.1-embed-amd64.zip").touch()
+            service = ser.PythonConfigService()
+            service.embed_path = Path(directory)
+
+            python = service.embed_python_by("Python 3.12.1")
+
+            self.assertIsNotNone(python)
+            if python is None:
+                return
+            self.assertEqual(python.long_version, "3.12.1")
+            self.assertIsNone(service.embed_python_by("3.12"))
+            self.assertIsNone(service.embed_python_by("Python 3.1"))
+            self.assertIsNone(service.embed_python_by(" "))
+
+    def test_get_path_translates_wsl_mounts_and_backslashes(self):
+        self.assertEqual(ser._get_path("/mnt/c/Users/dev"), "C:/Users/dev")
+        self.assertEqual(ser._get_path("/mnt/d/x"), "D:/x")
+        self.assertEqual(ser._get_path("C:\\Users\\dev\\lib"), "C:/Users/dev/lib")
+        self.assertEqual(ser._get_path("/mnt/d/lib\\site"), "D:/lib/site")
+        self.assertEqual(ser._get_path("/home/dev/mnt/c/lib"), "/home/dev/mnt/c/lib")
+        self.assertEqual(ser._get_path("/mnt/cd/lib"), "/mnt/cd/lib")
+
+    def test_write_path_file_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "dynamo.pth"
+            path_file = ser.PythonPathFile(
+                path, ["/mnt/d/x", "C:\\lib\\site", "C:/plain"]
+            )
+
+            ser.write_path_file(path_file)
+
+            self.assertEqual(
+                ser.read_path_file(path), ["D:/x", "C:/lib/site", "C:/plain"]
+            )
+            self.assertEqual(path.read_bytes(), b"D:/x\nC:/lib/site\nC:/plain")
+
 
 if __name__ == '__main__':
     unittest.main()